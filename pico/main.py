@@ -1,27 +1,66 @@
 # OLED fire animation for the 2024 HBO-ICT TI Christmas Challenge
 # Copyright 2024 Hogeschool Utrecht, Hagen Patzke
 # Made available under MIT License
-from time import sleep_ms
+import micropython
+from micropython import const
+from time import sleep_ms, ticks_add, ticks_diff, ticks_ms
 from machine import I2C, Pin
+from os import listdir, remove
 from ssd1309 import Display
 
-# I2C pins (preferably hardware pins)
+# I2C hardware bus and its pins
+I2C_ID = 0
 I2C_SCL = Pin(5)
 I2C_SDA = Pin(4)
-# I2C standard speeds, ready for selecting one by index.
+# I2C standard speeds, fastest first.
 # (5MHz never worked when testing, so I left it out.)
-I2C_FRQ = (3_400_000, 1_000_000, 400_000, 100_000)[2]
-# Number of milliseconds to sleep after each frame.
-FRAME_SLEEP = 100
+I2C_FRQS = (3_400_000, 1_000_000, 400_000, 100_000)
+# Index of the speed we try first; if the OLED does not answer we step down.
+I2C_FRQ_FIRST = 1
+# I2C address of the OLED display (8-bit notation, like the Display class)
+OLED_ADDRESS = 0x78
+# Number of milliseconds each frame is shown (including drawing and sending it).
+_FRAME_SLEEP = const(100)
+# Display size, and the height of its top (yellow) area
+_WIDTH = const(128)
+_HEIGHT = const(64)
+_BLUE_AREA = const(16)
+# Welcome screen text: (y, line) for each line of 8x8 pixel letters
+BANNER_LINES = (
+    (0x04, 'Merry Christmas!'),
+    (0x10, '  OLED SSD1306  '),
+    (0x18, '  DEMONSTRATION '),
+    (0x24, ' Presented  by  '),
+    (0x2C, '  Hogeschool    '),
+    (0x34, ' U t r e c h t  '),
+)
+# Welcome screen, pre-rendered in the format the OLED needs (VLSB), is kept in
+# this directory as banner<checksum of the text>.vlsb
+BANNER_DIR = "px128w64h"
+# Number of milliseconds the welcome screen is shown
+_BANNER_TIME = const(20_000)
+
+
+# Built-in LED, found on first use (see get_led())
+_led = None
+
+
+def get_led():
+    """Return the Pin of the built-in LED.
+       We find out only once which Pico we run on, then keep the result."""
+    global _led
+    if _led is None:
+        try:  # RasPi PICO-W needs to talk to the WiFi-chip for this
+            _led = Pin("LED", Pin.OUT)
+        except TypeError:  # RasPi PICO built-in LED is on Pin 25
+            _led = Pin(25, Pin.OUT)
+    return _led
 
 
 def pico_selftest():
     """Built-In Self Test (BIST).
        Flash the built-in LED three times."""
-    try:  # RasPi PICO-W needs to talk to the WiFi-chip for this
-        led = Pin("LED", Pin.OUT)
-    except TypeError:  # RasPi PICO built-in LED is on Pin 25
-        led = Pin(25, Pin.OUT)
+    led = get_led()
     for i in range(3):
         led.on()
         sleep_ms(200)
@@ -29,71 +68,177 @@ def pico_selftest():
         sleep_ms(200)
 
 
+def open_i2c():
+    """Open the I2C bus at the fastest speed the OLED display accepts.
+       Most boards work fine at 1MHz, but with long wires or weak pull-up
+       resistors the OLED may not acknowledge, so we try slower speeds too."""
+    for frq in I2C_FRQS[I2C_FRQ_FIRST:]:
+        i2c = I2C(I2C_ID, scl=I2C_SCL, sda=I2C_SDA, freq=frq)
+        try:
+            i2c.writeto(OLED_ADDRESS >> 1, b'\x80\xe3')  # NOP command as probe
+            return i2c
+        except OSError:  # no acknowledge from the OLED at this speed
+            pass
+    return i2c  # keep the slowest speed, Display() will report the error
+
+
+# Chance per row (0 ... 255) that a pixel in the flames stays dark.
+# Density decreases as we move up.
+FIRE_THRESHOLD = bytes(int((0.2 + 0.5 * (_HEIGHT - y) / 48) * 256) for y in range(_HEIGHT))
+
+
+@micropython.viper
+def _render_fire(fb: ptr8, thr: ptr8, state: uint, width: int, spark_pages: int, pages: int) -> uint:
+    """Render one frame of generated fire into fb (VLSB, width x pages * 8).
+       Random numbers come from a xorshift32 generator, its state is passed
+       in and returned so the next frame can continue with it."""
+    r = state
+    x = 0
+    while x < width:
+        page = 0
+        while page < spark_pages:
+            # Create a randomized spark effect in yellow part:
+            # AND-ing four random bytes leaves each bit set with p = 1/16.
+            r ^= r << 13
+            r ^= r >> 17
+            r ^= r << 5
+            fb[page * width + x] = int(r & (r >> 8) & (r >> 16) & (r >> 24)) & 0xFF
+            page += 1
+        while page < pages:
+            # One random byte per pixel, compared against the row threshold.
+            # Each 8 vertical pixel decisions are packed into one page byte.
+            y = page << 3
+            page_byte = 0
+            bit = 0
+            while bit < 8:
+                r ^= r << 13
+                r ^= r >> 17
+                r ^= r << 5
+                if int(r & 0xFF) > thr[y + bit]:
+                    page_byte |= 1 << bit
+                bit += 1
+            fb[page * width + x] = page_byte
+            page += 1
+        x += 1
+    return r
+
+
 def test_fireplace_animation(display):
     """Attempt at generating a fire animation programmatically.
-       (Alas, it does not look very convincing. It is also very slow.)
+       (Alas, it does not look very convincing.)
        [NOT USED - Left here to experiment with.]
+       We build each frame directly in the format the OLED needs (VLSB):
+       one byte holds 8 vertical pixels, one 'page' row holds 128 bytes.
     """
-    from random import random
-    WIDTH = 128
-    HEIGHT = 64
-    BLUE_AREA = 16
+    from os import urandom
+    fb = bytearray(_WIDTH * _HEIGHT // 8)
+    state = int.from_bytes(urandom(4), 'little') | 1  # xorshift state must not be 0
     for repeat in range(25):
-        display.clear_buffers()
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                if y < BLUE_AREA:
-                    # Create a randomized spark effect in yellow part
-                    if random() > 0.95:
-                        display.draw_pixel(x, y)
-                else:
-                    # Density decreases as we move up
-                    intensity_threshold = 0.2 + 0.5 * (64 - y) / 48
-                    if random() > intensity_threshold:
-                        display.draw_pixel(x, y)
-        display.present()
+        state = _render_fire(fb, FIRE_THRESHOLD, state, _WIDTH, _BLUE_AREA >> 3, _HEIGHT >> 3)
+        # No need to draw into the display buffer, send the frame as-is.
+        display.present_buf(fb, _WIDTH, _HEIGHT)
+
+
+def banner_checksum(lines):
+    """Checksum (djb2, 24 bits) of the banner lines and their positions."""
+    h = 5381
+    for y, text in lines:
+        for c in chr(y) + text:
+            h = (h * 33 + ord(c)) & 0xFFFFFF
+    return h
 
 
 def show_welcome_banner(display):
-    display.clear_buffers()
-    display.draw_text8x8(0, 0x04, 'Merry Christmas!')
-    display.draw_text8x8(0, 0x10, '  OLED SSD1306  ')
-    display.draw_text8x8(0, 0x18, '  DEMONSTRATION ')
-    display.draw_text8x8(0, 0x24, ' Presented  by  ')
-    display.draw_text8x8(0, 0x2C, '  Hogeschool    ')
-    display.draw_text8x8(0, 0x34, ' U t r e c h t  ')
-    display.present()
+    """Show the welcome message.
+       The first time, we render the text and save the result in the format
+       the OLED needs. After that we only load the file, right behind the
+       I2C control byte, and send it as it is.
+       The file name holds a checksum of the text, so when the text changes
+       we render it again (and remove the old file)."""
+    name = f"banner{banner_checksum(BANNER_LINES):06x}.vlsb"
+    path = f"{BANNER_DIR}/{name}"
+    try:
+        banner = display.load_prepped(path)
+    except OSError:  # no (complete) banner file for this text yet
+        display.clear_buffers()
+        for y, text in BANNER_LINES:
+            display.draw_text8x8(0, y, text)
+        try:
+            display.save_buf(path, display.mono_image)
+        except OSError:  # e.g. file system full or read-only: show it anyway
+            try:
+                remove(path)  # do not leave half a file behind
+            except OSError:
+                pass
+        else:
+            # Remove banners of an older text
+            try:
+                for old in listdir(BANNER_DIR):
+                    if old != name and old.startswith("banner") and old.endswith(".vlsb"):
+                        remove(f"{BANNER_DIR}/{old}")
+            except OSError:  # keep the new banner; try again next time
+                pass
+        display.present()
+    else:
+        display.present_prepped(banner)
 
 
 def prepare_fireplace_animation(display):
     """Load image data from disk and pre-process it for animation.
-       We add each frame and add its mirror image.
-       Goal is a better animation for this application (fire)."""
+       We show each frame and its mirror image.
+       Goal is a better animation for this application (fire).
+       Each frame is kept 'prepped': in the format the OLED needs, ready to
+       send without copying. Mirror images are made while playing, so we
+       keep only 4 frames in memory."""
     frame_array = []
-    maxi = 0
     for x in range(4):
-        # Load a 128x64 monochrome bitmap from a file.
-        buf = display.load_buf(f"px128w64h/vuur{x}.mono", 128, 64)
-        # Convert the bitmap to a frame buffer.
-        frame_array.append(display.make_fb(buf, 128, 64))
-        maxi += 1
-        # Mirror the bitmap and convert the result to a frame buffer.
-        frame_array.append(display.make_fb(display.mirror_horizontal(buf, 128, 64), 128, 64))
-        maxi += 1
+        # Load a 128x64 monochrome bitmap from a (run-length encoded) file.
+        buf = display.load_rle(f"px128w64h/vuur{x}.rle", _WIDTH, _HEIGHT)
+        # Draw it, and keep a prepped copy of the result.
+        display.draw_sprite(display.make_fb(buf, _WIDTH, _HEIGHT), 0, 0, _WIDTH, _HEIGHT)
+        frame_array.append(display.copy_prepped())
+    # Each frame is followed by its mirror image: (frame number, mirrored)
+    steps = [(x, mirrored) for x in range(4) for mirrored in (False, True)]
     # To play the animation forward and back without any duplicates we make
-    # a list of the frame numbers to play in order.
-    frame_list = list(range(0, maxi)) + list(range(maxi - 2, 0, -1))
-    # print("show", maxi, "list", frame_list)
-    return frame_array, frame_list
+    # a list of the steps to play in order.
+    frame_list = steps + [steps[n] for n in range(len(steps) - 2, 0, -1)]
+    # print("show", len(steps), "list", frame_list)
+    # The list does not change, so we look up the frames now, not while playing.
+    # We also compare every step with the step before, to see which pages
+    # (rows of 8 pixels) change. Only those have to be sent.
+    # The first step is always sent in full, so each round starts clean.
+    play_sequence = []
+    previous = None
+    for x, mirrored in frame_list:
+        image = frame_array[x]
+        shown = bytes(display.mirror_prepped(image)) if mirrored else image
+        pages = 0xFF
+        if previous is not None:
+            pages = sum(1 << p for p in range(_HEIGHT >> 3)
+                        if shown[1 + p * _WIDTH:1 + (p + 1) * _WIDTH] != previous[1 + p * _WIDTH:1 + (p + 1) * _WIDTH])
+        play_sequence.append((image, mirrored, pages))
+        previous = shown
+    return tuple(play_sequence)
 
 
-def play_fireplace_animation(display, fbuf_array, displaylist):
-    """Show the fireplace animation, one picture at a time."""
-    # display.clear_buffers()  -- image is full screen, we don't need to clear before
-    for i in displaylist:
-        display.draw_sprite(fbuf_array[i], 0, 0, 128, 64)
-        display.present()
-        sleep_ms(FRAME_SLEEP)
+def play_fireplace_animation(display, play_sequence):
+    """Show the fireplace animation, one picture at a time.
+       The play sequence holds (prepped image, mirrored, pages) steps,
+       pages being the bit mask of pages that changed since the step before."""
+    # Look up the methods only once, not for every frame.
+    mirror = display.mirror_prepped
+    show = display.present_prepped
+    # We sleep until the next frame is due, not a fixed time after sending,
+    # so the time for drawing and sending does not add to the frame time.
+    deadline = ticks_ms()
+    for image, mirrored, pages in play_sequence:
+        deadline = ticks_add(deadline, _FRAME_SLEEP)
+        if mirrored:
+            image = mirror(image)
+        show(image, pages)
+        wait = ticks_diff(deadline, ticks_ms())
+        if wait > 0:
+            sleep_ms(wait)
 
 
 # main #########################
@@ -101,16 +246,22 @@ def play_fireplace_animation(display, fbuf_array, displaylist):
 # Flash Built-In LED three times
 pico_selftest()
 # Initialize I2C with pins and frequency
-i2c = I2C(0, scl=I2C_SCL, sda=I2C_SDA, freq=I2C_FRQ)
+i2c = open_i2c()
 # print('I2C scan:', i2c.scan())  # DEBUG
-display = Display(i2c)
+# To send frames with DMA on the RP2040, add i2c_id=I2C_ID (not yet tested on hardware).
+display = Display(i2c, OLED_ADDRESS)
 # Show the welcome message
 show_welcome_banner(display)
-sleep_ms(20_000)  # without a delay here we can't read any of it :-)
-# Prepare the animation (we need to do this only one time)
-frame_array, frame_list = prepare_fireplace_animation(display)
+banner_shown = ticks_ms()
+# Prepare the animation (we need to do this only one time),
+# while the welcome message is on the screen.
+play_sequence = prepare_fireplace_animation(display)
+# Without a delay here we can't read any of it :-)
+wait = ticks_diff(ticks_add(banner_shown, _BANNER_TIME), ticks_ms())
+if wait > 0:
+    sleep_ms(wait)
 # Play the fire animation
 while True:  # (forever)
-    play_fireplace_animation(display, frame_array, frame_list)
+    play_fireplace_animation(display, play_sequence)
 
 # eof ########## (end of file)
@@ -11,16 +11,325 @@
       - add buf_hmsb_to_vlsb() to allow pre-computing image buffers in the format the OLED needs
     - add mirror_horizontal() function
     - remove 8-bit image display routine (load_sprite() now loads monochrome image data)
+
+    Changes in October 2026:
+    - present() sends the whole frame buffer in one I2C transaction,
+      directly from the frame buffer memory
+    - mono_image is now a memoryview (into the transmit buffer) instead of
+      a bytearray; write_data(), present_buf() and save_buf() accept either
+    - the display RAM address window is only sent when it changes
+    - add draw_sprite_mirrored() to mirror a sprite while drawing it
+    - add present_pages() to send only the changed parts of the image
+    - add load_rle() for run-length encoded bitmap files
+    - on the RP2040, optionally send image data with DMA (see i2c_id)
+    - add present_prepped() to send images prepared in the format the OLED needs
+    - mirror_horizontal() uses a bit reversal table, in a viper function
+    - add write_cmds() to send a command sequence in one I2C transaction;
+      write_data() and set_window() send from preallocated buffers that
+      start with the control byte, so they do not allocate per call
+    - add load_vlsb_sprite() and draw_bitmap_vlsb() for bitmaps converted
+      to VLSB on the PC (tools/vlsb_encode.py)
 """
+from array import array
+from collections import OrderedDict
 from math import cos, sin, pi, radians
+from time import ticks_diff, ticks_ms
+import micropython
 from micropython import const
 from framebuf import FrameBuffer, MONO_HMSB, MONO_VLSB
+try:  # RP2040: we can feed the I2C hardware with DMA
+    from machine import mem32
+    from rp2 import DMA
+except ImportError:  # other ports, or MicroPython without rp2.DMA
+    DMA = None
+
+# RP2040 I2C hardware: register base and DMA request (TX) per bus
+I2C_REGS = (0x40044000, 0x40048000)
+I2C_DREQ_TX = (32, 34)
+# RP2040 I2C register offsets
+_IC_TAR = const(0x04)
+_IC_DATA_CMD = const(0x10)
+_IC_RAW_INTR_STAT = const(0x34)
+_IC_CLR_TX_ABRT = const(0x54)
+_IC_ENABLE = const(0x6C)
+_IC_STATUS = const(0x70)
+_IC_DMA_CR = const(0x88)
+_IC_DMA_TDLR = const(0x8C)
+# Maximum time (ms) a DMA transfer may take (1KB at 100kHz takes ~95ms)
+_DMA_TIMEOUT = const(250)
+# Number of font letters that draw_letter() keeps ready to draw
+_GLYPH_CACHE_SIZE = const(64)
+# Number of polygon shapes that _polygon_coords() keeps
+_POLYGON_CACHE_SIZE = const(16)
 
 
 def get_byte_size(width):
     return ((width - 1) >> 3) + 1
 
 
+# Bit reversal table: BITREV[b] holds the 8 bits of b in reverse order.
+BITREV = bytearray(256)
+for _b in range(1, 256):
+    BITREV[_b] = (BITREV[_b >> 1] >> 1) | ((_b & 1) << 7)
+
+
+@micropython.viper
+def _rle_decode(src: ptr8, src_len: int, dst: ptr8, dst_len: int) -> int:
+    """Decode run-length encoded data (see load_rle()).
+       Returns the number of bytes written to dst."""
+    i = 0
+    o = 0
+    while i < src_len and o < dst_len:
+        c = src[i]
+        i += 1
+        if c & 0x80:  # run: next byte, (c & 0x7F) + 3 times
+            n = (c & 0x7F) + 3
+            v = src[i]
+            i += 1
+            while n > 0 and o < dst_len:
+                dst[o] = v
+                o += 1
+                n -= 1
+        else:  # literal: next c + 1 bytes
+            n = c + 1
+            while n > 0 and o < dst_len and i < src_len:
+                dst[o] = src[i]
+                o += 1
+                i += 1
+                n -= 1
+    return o
+
+
+@micropython.viper
+def _mirror_pages(src: ptr8, dst: ptr8, w: int, pages: int):
+    """Mirror a VLSB image horizontally: reverse the bytes of each page.
+       Both buffers start with a control byte, which is skipped."""
+    p = 0
+    while p < pages:
+        beg = 1 + p * w
+        end = beg + w - 1
+        i = 0
+        while i < w:
+            dst[beg + i] = src[end - i]
+            i += 1
+        p += 1
+
+
+@micropython.viper
+def _i2c_data_cmds(src: ptr8, n: int, dst: ptr16):
+    """Fill dst with RP2040 I2C commands (IC_DATA_CMD values) that send
+       the control byte 0x40 and n bytes from src, then a STOP."""
+    dst[0] = 0x40
+    i = 0
+    while i < n:
+        dst[i + 1] = src[i]
+        i += 1
+    dst[n] = dst[n] | 0x200  # STOP after the last byte
+
+
+@micropython.viper
+def _clear_bytes(buf: ptr8, n: int):
+    """Set the first n bytes of buf to zero."""
+    i = 0
+    while i < n:
+        buf[i] = 0
+        i += 1
+
+
+@micropython.viper
+def _invert_bytes(buf: ptr8, n: int):
+    """Invert the first n bytes of buf in place."""
+    i = 0
+    while i < n:
+        buf[i] = buf[i] ^ 0xFF
+        i += 1
+
+
+@micropython.viper
+def _mirror_hmsb(src: ptr8, dst: ptr8, w: int, h: int, w_bytes: int, bitrev: ptr8):
+    """Mirror a MONO_HMSB bitmap (w x h) horizontally into dst.
+       Each row is reversed byte by byte, with bitrev (BITREV) reversing
+       the bits. When w is not a multiple of 8 the reversed row starts
+       with the padding bits, so we shift it back by that many bits."""
+    s = (w_bytes << 3) - w
+    row = 0
+    end = w_bytes * h
+    while row < end:
+        last = row + w_bytes - 1
+        i = 0
+        if s == 0:
+            while i < w_bytes:
+                dst[row + i] = bitrev[src[last - i]]
+                i += 1
+        else:
+            cur = bitrev[src[last]]
+            while i < w_bytes:
+                nxt = 0
+                if i + 1 < w_bytes:
+                    nxt = bitrev[src[last - i - 1]]
+                dst[row + i] = ((cur >> s) | (nxt << (8 - s))) & 0xFF
+                cur = nxt
+                i += 1
+        row += w_bytes
+
+
+@micropython.viper
+def _rot90_hmsb(src: ptr8, dst: ptr8, w: int, h: int, w_bytes: int, h_bytes: int, inv: int):
+    """Rotate a MONO_HMSB bitmap (w x h) 90 degrees to the right into dst
+       (h x w). dst must be zeroed. Source bytes are XOR-ed with inv
+       (0xFF inverts the image). Each source byte is loaded once and its
+       8 pixels are unpacked."""
+    y1 = 0
+    while y1 < h:
+        src_row = y1 * w_bytes
+        x2 = (h - 1) - y1
+        dst_col = x2 >> 3
+        dst_mask = 1 << (x2 & 7)
+        xb = 0
+        while xb < w_bytes:
+            src_byte = src[src_row + xb] ^ inv
+            x1 = xb << 3
+            end = x1 + 8
+            if end > w:  # padding bits of the last byte
+                end = w
+            dst_idx = x1 * h_bytes + dst_col
+            while src_byte != 0 and x1 < end:
+                if src_byte & 1:
+                    dst[dst_idx] = dst[dst_idx] | dst_mask
+                src_byte >>= 1
+                dst_idx += h_bytes
+                x1 += 1
+            xb += 1
+        y1 += 1
+
+
+@micropython.viper
+def _rot270_hmsb(src: ptr8, dst: ptr8, w: int, h: int, w_bytes: int, h_bytes: int, inv: int):
+    """Rotate a MONO_HMSB bitmap (w x h) 90 degrees to the left into dst
+       (h x w). dst must be zeroed. Source bytes are XOR-ed with inv
+       (0xFF inverts the image). Each source byte is loaded once and its
+       8 pixels are unpacked."""
+    y1 = 0
+    while y1 < h:
+        src_row = y1 * w_bytes
+        dst_col = y1 >> 3
+        dst_mask = 1 << (y1 & 7)
+        xb = 0
+        while xb < w_bytes:
+            src_byte = src[src_row + xb] ^ inv
+            x1 = xb << 3
+            end = x1 + 8
+            if end > w:  # padding bits of the last byte
+                end = w
+            dst_idx = ((w - 1) - x1) * h_bytes + dst_col
+            while src_byte != 0 and x1 < end:
+                if src_byte & 1:
+                    dst[dst_idx] = dst[dst_idx] | dst_mask
+                src_byte >>= 1
+                dst_idx -= h_bytes
+                x1 += 1
+            xb += 1
+        y1 += 1
+
+
+@micropython.viper
+def _hmsb_to_vlsb(src: ptr8, dst: ptr8, w: int, h: int, w_bytes: int):
+    """Convert a MONO_HMSB bitmap (w x h) to VLSB, in tiles of 8x8 pixels.
+       A tile is 8 source bytes (one per row), packed in two 32-bit words and
+       transposed with shifts and masks (transpose8 from Hacker's Delight).
+       The result is the 8 bytes of the tile's page, stored side by side."""
+    m = 0x0F0F0F0F
+    m_hi = m << 4  # 0xF0F0F0F0
+    y = 0
+    while y < h:
+        rows = h - y
+        if rows > 8:  # the last page can be partial
+            rows = 8
+        dst_idx = (y >> 3) * w
+        xb = 0
+        while xb < w_bytes:
+            # Rows 0..3 go in lo, rows 4..7 in hi, the first row lowest.
+            lo = 0
+            hi = 0
+            idx = y * w_bytes + xb
+            r = 0
+            while r < rows:
+                if r < 4:
+                    lo |= src[idx] << (r << 3)
+                else:
+                    hi |= src[idx] << ((r - 4) << 3)
+                idx += w_bytes
+                r += 1
+            # Transpose the 2x2 bit blocks, then 4x4, then the halves.
+            t = (hi ^ (hi >> 7)) & 0x00AA00AA
+            hi = hi ^ t ^ (t << 7)
+            t = (lo ^ (lo >> 7)) & 0x00AA00AA
+            lo = lo ^ t ^ (t << 7)
+            t = (hi ^ (hi >> 14)) & 0x0000CCCC
+            hi = hi ^ t ^ (t << 14)
+            t = (lo ^ (lo >> 14)) & 0x0000CCCC
+            lo = lo ^ t ^ (t << 14)
+            t = (hi & m_hi) | ((lo >> 4) & m)
+            lo = ((hi << 4) & m_hi) | (lo & m)
+            hi = t
+            # Now lo holds columns 0..3 and hi columns 4..7, the first lowest.
+            # Padding bits of the last byte end up in columns we do not store.
+            cols = w - (xb << 3)
+            if cols > 8:
+                cols = 8
+            c = 0
+            while c < cols:
+                if c < 4:
+                    dst[dst_idx] = (lo >> (c << 3)) & 0xFF
+                else:
+                    dst[dst_idx] = (hi >> ((c - 4) << 3)) & 0xFF
+                dst_idx += 1
+                c += 1
+            xb += 1
+        y += 8
+
+
+@micropython.viper
+def _circle_vlsb(fb: ptr8, w: int, x0: int, y0: int, r: int, color: int):
+    """Draw a circle (midpoint algorithm) straight into a VLSB image of
+       width w, setting (color 1) or clearing (color 0) its pixels.
+       All pixels must be on the image."""
+    f = 1 - r
+    dx = 1
+    dy = -r - r
+    x = 0
+    y = r
+    while True:
+        # Plot the 8 reflections of (x, y); at x = 0 these are the
+        # top, bottom, left and right pixels.
+        k = 0
+        while k < 8:
+            if k & 4:
+                a = y
+                b = x
+            else:
+                a = x
+                b = y
+            px = x0 - a if k & 1 else x0 + a
+            py = y0 - b if k & 2 else y0 + b
+            idx = (py >> 3) * w + px
+            mask = 1 << (py & 7)
+            if color:
+                fb[idx] = fb[idx] | mask
+            else:
+                fb[idx] = fb[idx] & (0xFF ^ mask)
+            k += 1
+        if x >= y:
+            break
+        if f >= 0:
+            y -= 1
+            dy += 2
+            f += dy
+        x += 1
+        dx += 2
+        f += dx
+
+
 class Display(object):
     """Serial interface for monochrome OLED display.
 
@@ -72,7 +381,8 @@ class Display(object):
     PRECHARGE_PERIOD = const(0xd9)
     VCOM_DESELECT_LEVEL = const(0xdb)
 
-    def __init__(self, i2c, address=0x78, width=128, height=64):
+    def __init__(self, i2c, address=0x78, width=128, height=64, i2c_id=None,
+                 verbose=True):
         """Constructor for Display.
 
         Args:
@@ -80,23 +390,69 @@ class Display(object):
             address (Optional int): I2C address (default 0x78)
             width (Optional int): Screen width (default 128)
             height (Optional int): Screen height (default 64)
+            i2c_id (Optional int): Hardware I2C bus (0 or 1) of i2c.
+                On the RP2040 this lets present() send the image with DMA,
+                and return while the data is still being sent.
+                (Not yet tested on hardware, so it is off by default.)
+            verbose (Optional bool): Print a message when drawing off screen
+                (default True).
         """
         self.i2c = i2c
         self.address = (address >> 1)
+        self._i2c_writeto = i2c.writeto  # bound once, used for every frame
         self.width = width
         self.height = height
+        # Largest x and y on screen, for the bounds tests
+        self._w1 = width - 1
+        self._h1 = height - 1
+        self._verbose = verbose
         self.pages = self.height // 8
+        self._all_pages = (1 << self.pages) - 1  # page mask for the whole image
         self.byte_width = -(-width // 8)  # Ceiling division
         self.buffer_length = self.byte_width * height
-        # Buffer
-        self.mono_image = bytearray(self.buffer_length)
+        # Transmit Buffer: control byte 0x40 ('data follows') + image data
+        self._txbuf = bytearray(1 + self.buffer_length)
+        self._txbuf[0] = 0x40
+        # Buffer: part of the transmit buffer, so we can send it without copying
+        self.mono_image = memoryview(self._txbuf)[1:]
         # Frame Buffer
         self.monoFB = FrameBuffer(self.mono_image, width, height, MONO_VLSB)
+        # Control byte 0x40 + data, for write_data() (allocated on first use)
+        self._databuf = None
+        # Command packet for set_window(): control byte 0x00 + 6 command bytes
+        self._window_cmds = bytearray(7)
+        # Display RAM window (w, h) we sent last, None = unknown
+        self._window = None
+        # Letters from font.get_letter(), most recently used last (see draw_letter())
+        self._glyph_cache = OrderedDict()
+        # Scratch bitmaps for images we only draw, by size (see _scratch_buf())
+        self._scratch = {}
+        # Polygon vertex offsets from the center, see _polygon_coords()
+        self._polygon_cache = {}
+        # Minimum and maximum x per row, for fill_polygon()
+        self._xmin = array('h', [0] * height)
+        self._xmax = array('h', [0] * height)
+        # Scratch bitmap for draw_sprite_mirrored(): (w, h, buf, fb)
+        self._mirror = None
+        # Scratch buffer for mirror_prepped()
+        self._mirror_prepped = None
+        # DMA channel and two I2C command buffers (one 16-bit command per byte):
+        # while one is being sent, the next image goes into the other one.
+        self._dma = None
+        if i2c_id is not None and DMA is not None:
+            self._i2c_regs = I2C_REGS[i2c_id]
+            self._dma = DMA()
+            self._dma_ctrl = self._dma.pack_ctrl(size=1, inc_write=False, treq_sel=I2C_DREQ_TX[i2c_id])
+            self._dma_bufs = (bytearray(2 * (1 + self.buffer_length)),
+                              bytearray(2 * (1 + self.buffer_length)))
+            self._dma_next = 0  # index of the command buffer to fill next
+            mem32[self._i2c_regs + _IC_DMA_TDLR] = 4  # request data when TX FIFO has 4 or less
+            mem32[self._i2c_regs + _IC_DMA_CR] = 0x02  # TDMAE: TX DMA enable
         self.clear_buffers()
 
         self.reset()
-        # Send initialization commands
-        for cmd in (
+        # Send initialization commands, all in one I2C transaction
+        self.write_cmds(bytes((
                 self.DISPLAY_OFF,
                 self.DISPLAY_CLOCK_DIV, 0x80,
                 self.MUX_RATIO, self.height - 1,
@@ -113,8 +469,8 @@ class Display(object):
                 self.VCOM_DESELECT_LEVEL, 0x40,
                 self.ENTIRE_DISPLAY_ON,  # output follows RAM contents
                 self.INVERSION_OFF,  # not inverted
-                self.DISPLAY_ON):  # on
-            self.write_cmd(cmd)
+                self.DISPLAY_ON)))  # on
+        self.set_window(self.width, self.height)
 
         self.clear_buffers()
         self.present()
@@ -132,21 +488,51 @@ class Display(object):
             command (byte): Display command code.
             *args (optional bytes): Data to transmit.
         """
-        self.i2c.writeto(self.address, bytearray([0x80, command]))
-        # Handle any passed data
         if len(args) > 0:
-            self.write_data(args)
+            # Command parameters are sent as commands too, all in one go
+            self.write_cmds(bytes((command,) + args))
+            return
+        self.wait_present()
+        self.i2c.writeto(self.address, bytearray([0x80, command]))
+
+    def write_cmds(self, commands):
+        """Write a sequence of commands to display in one transaction.
+
+        Args:
+            commands (bytes): Command codes and their parameters.
+        """
+        self.wait_present()
+        # Control byte 0x00: only commands follow
+        self._i2c_writeto(self.address, b'\x00' + bytes(commands))
 
     def write_data(self, data):
         """Write data to display.
 
         Args:
-            data (bytes): Data to transmit.
+            data (bytes, bytearray, memoryview or int): Data to transmit.
+        Note:
+            The internal frame buffer (mono_image) is sent as it is. Other
+            data up to the image size is copied behind the control byte in
+            a buffer that is allocated once, on first use.
         """
-        if isinstance(data, bytearray):
-            self.i2c.writeto(self.address, bytearray([0x40]) + data)
-        else:
-            self.i2c.writeto(self.address, bytearray([0x40, data]))
+        try:
+            self.wait_present()
+            if isinstance(data, int):
+                self._i2c_writeto(self.address, bytearray([0x40, data]))
+            elif data is self.mono_image:
+                self._i2c_writeto(self.address, self._txbuf)
+            elif len(data) <= self.buffer_length:
+                if self._databuf is None:
+                    self._databuf = memoryview(bytearray(1 + self.buffer_length))
+                    self._databuf[0] = 0x40
+                n = 1 + len(data)
+                self._databuf[1:n] = data
+                self._i2c_writeto(self.address, self._databuf[:n])
+            else:
+                self._i2c_writeto(self.address, b'\x40' + bytes(data))
+        except OSError:
+            self._window = None  # the RAM pointer may have stopped mid-window
+            raise
 
     def clear(self):
         """Clear display."""
@@ -157,95 +543,104 @@ class Display(object):
         """Clear internal frame buffer."""
         self.monoFB.fill(0x00)
 
-    def xform_buf(self, buf, w, h, invert=False, rotate=0):
+    def xform_buf(self, buf, w, h, invert=False, rotate=0, buf2=None):
         """Transform a given bytearray with bitmap data to a new bytearray.
            Options are rotation in 90 degree steps and inverting the image.
+           (Without rotation, inverting changes the given buffer itself.)
+           A zeroed buf2 of the right size can be given to reuse memory
+           for the rotated result.
         """
         w_bytes = get_byte_size(w)
         h_bytes = get_byte_size(h)
         new_w, new_h = w, h
 
         buf_len = len(buf)
-
-        if invert:  # if we need to invert, do it within the initial buffer
-            for idx in range(buf_len):
-                buf[idx] ^= 0xFF
-            # This is an elegant alternative, but allocates a new buffer, 
-            # so is likely less efficient:
-            # buf = bytearray(map(lambda b: b ^ 0xFF, buf))
+        # Inverting is done while rotating, so we go through the data once.
+        inv_mask = 0xFF if invert else 0x00
 
         if rotate == 180:  # 180 degrees -> reverse buffer order and bit order
-            buf2 = bytearray(buf_len)
+            if buf2 is None:
+                buf2 = bytearray(buf_len)
+            bitrev = BITREV
             for idx in range(buf_len):
-                # reverse bit order
-                cur_byte = buf[idx]
-                new_byte = 0
-                for i in range(8):
-                    new_byte <<= 1
-                    new_byte |= (cur_byte & 1)
-                    cur_byte >>= 1
-                buf2[buf_len - 1 - idx] = new_byte
+                # reverse bit order with the lookup table
+                buf2[buf_len - 1 - idx] = bitrev[buf[idx]] ^ inv_mask
             buf = buf2
         elif rotate == 90:  # 90 degrees to the right
             new_w, new_h = h, w
             buf2_len = h_bytes * w
-            buf2 = bytearray(buf2_len)
-            for y1 in range(h):
-                for x1 in range(w):
-                    y2 = x1
-                    x2 = (h - 1) - y1
-                    src_idx = (y1 * w_bytes) + (x1 >> 3)
-                    src_bit = x1 & 7
-                    dst_idx = (y2 * h_bytes) + (x2 >> 3)
-                    dst_bit = x2 & 7
-                    val_bit = ((buf[src_idx] >> src_bit) & 1) << dst_bit
-                    buf2[dst_idx] |= val_bit
+            if buf2 is None:
+                buf2 = bytearray(buf2_len)
+            _rot90_hmsb(buf, buf2, w, h, w_bytes, h_bytes, inv_mask)
             buf = buf2
         elif rotate == 270:  # 90 degrees to the left
             new_w, new_h = h, w
             buf2_len = h_bytes * w
-            buf2 = bytearray(buf2_len)
-            for y1 in range(h):
-                for x1 in range(w):
-                    y2 = (w - 1) - x1
-                    x2 = y1
-                    src_idx = (y1 * w_bytes) + (x1 >> 3)
-                    src_bit = x1 & 7
-                    dst_idx = (y2 * h_bytes) + (x2 >> 3)
-                    dst_bit = x2 & 7
-                    val_bit = ((buf[src_idx] >> src_bit) & 1) << dst_bit
-                    buf2[dst_idx] |= val_bit
+            if buf2 is None:
+                buf2 = bytearray(buf2_len)
+            _rot270_hmsb(buf, buf2, w, h, w_bytes, h_bytes, inv_mask)
             buf = buf2
+        elif invert:  # no rotation: invert within the initial buffer
+            _invert_bytes(buf, buf_len)
 
         return buf, new_w, new_h
 
-    def mirror_horizontal(self, buf, w, h):
+    def mirror_horizontal(self, buf, w, h, buf2=None):
+        """Mirror a MONO_HMSB bitmap horizontally.
+
+            Args:
+                buf (bytearray): bitmap in HMSB format.
+                w (int): horizontal width.
+                h (int): vertical height.
+                buf2 (Optional bytearray): buffer for the result, to reuse memory.
+            Returns:
+                bytearray: mirrored bitmap
+        """
         w_bytes = get_byte_size(w)
         buf2_len = w_bytes * h
-        buf2 = bytearray(buf2_len)
-        for y1 in range(h):
-            for x1 in range(w // 2):  # swap left with right
-                x2 = (w - 1) - x1
-                y2 = y1
-                src_idx = (y1 * w_bytes) + (x1 >> 3)
-                src_bit = x1 & 7
-                dst_idx = (y2 * w_bytes) + (x2 >> 3)
-                dst_bit = x2 & 7
-                # left part
-                val_bit1 = ((buf[src_idx] >> src_bit) & 1) << dst_bit
-                buf2[dst_idx] |= val_bit1
-                # right part
-                val_bit2 = ((buf[dst_idx] >> dst_bit) & 1) << src_bit
-                buf2[src_idx] |= val_bit2
+        if buf2 is None:
+            buf2 = bytearray(buf2_len)
+        _mirror_hmsb(buf, buf2, w, h, w_bytes, BITREV)
         return buf2
 
     def load_buf(self, path, w, h):
         """Load a bitmap from a file."""
-        array_size = get_byte_size(w) * h
+        buf = bytearray(get_byte_size(w) * h)
+        with open(path, "rb") as f:
+            f.readinto(buf)  # no intermediate bytes object
+        return buf
+
+    def load_rle(self, path, w, h):
+        """Load a run-length encoded bitmap from a file.
+           Each block starts with a control byte c:
+           - c < 0x80: c + 1 literal bytes follow
+           - c >= 0x80: one byte follows, to repeat (c & 0x7F) + 3 times
+           (On the PC, tools/rle_encode.py makes these files.)
+        """
+        buf = bytearray(get_byte_size(w) * h)
+        with open(path, "rb") as f:
+            data = f.read()
+        _rle_decode(data, len(data), buf, len(buf))
+        return buf
+
+    def load_prepped(self, path):
+        """Load a full screen image in the format the OLED needs (VLSB)
+           from a file, into a new prepped buffer (see present_prepped()).
+           Raises OSError when the file does not hold exactly one image
+           (e.g. cut short, or made for another display size)."""
+        buf = bytearray(1 + self.buffer_length)
+        buf[0] = 0x40
         with open(path, "rb") as f:
-            buf = bytearray(f.read(array_size))
+            n = f.readinto(memoryview(buf)[1:])
+            if n != self.buffer_length or f.read(1):
+                raise OSError(22)  # EINVAL
         return buf
 
+    def save_buf(self, path, buf):
+        """Save a bitmap to a file."""
+        with open(path, "wb") as f:
+            f.write(buf)
+
     def make_fb(self, buf, w, h):
         """Convert a bitmap to a HMSB frame buffer."""
         fb = FrameBuffer(buf, w, h, MONO_HMSB)
@@ -282,8 +677,64 @@ class Display(object):
         Notes:
             w x h cannot exceed 2048
         """
-        fb = self.load_sprite(path, w, h, invert, rotate)
-        self.monoFB.blit(fb, x, y)
+        buf = self.load_buf(path, w, h)
+        # We only draw the result, so a rotated image can go to a scratch buffer.
+        if rotate:
+            n = get_byte_size(h) * w if rotate in (90, 270) else len(buf)
+            buf2 = self._scratch_buf(n)
+        else:
+            buf2 = None
+        buf, new_w, new_h = self.xform_buf(buf, w, h, invert, rotate, buf2)
+        self.monoFB.blit(self.make_fb(buf, new_w, new_h), x, y)
+
+    def load_vlsb_sprite(self, path):
+        """Load a sprite that is stored in the format the OLED needs (VLSB).
+           The file starts with the width and height (2 bytes each, little
+           endian), so no conversion is needed on the Pico.
+           (On the PC, tools/vlsb_encode.py makes these files.)
+
+        Args:
+            path (string): Image file path.
+
+        Returns:
+             FrameBuffer with the image data
+
+        Raises:
+            OSError: The file is too short for its header or its size.
+        """
+        with open(path, "rb") as f:
+            head = f.read(4)
+            if len(head) != 4:
+                raise OSError(22)  # EINVAL
+            w = head[0] | (head[1] << 8)
+            h = head[2] | (head[3] << 8)
+            buf = bytearray(w * ((h + 7) >> 3))
+            if f.readinto(buf) != len(buf):
+                raise OSError(22)  # EINVAL
+        return FrameBuffer(buf, w, h, MONO_VLSB)
+
+    def draw_bitmap_vlsb(self, path, x, y):
+        """Load a VLSB sprite from disc (see load_vlsb_sprite()) and draw it
+           to the internal screen representation.
+
+        Args:
+            path (string): Image file path.
+            x (int): x-coord of image.
+            y (int): y-coord of image.
+        """
+        self.monoFB.blit(self.load_vlsb_sprite(path), x, y)
+
+    def _scratch_buf(self, n):
+        """Return a zeroed scratch buffer of n bytes.
+           Buffers are kept per size and reused by the next call, so only
+           use this for data that is drawn right away, not kept."""
+        buf = self._scratch.get(n)
+        if buf is None:
+            buf = bytearray(n)
+            self._scratch[n] = buf
+        else:
+            _clear_bytes(buf, n)
+        return buf
 
     def draw_circle(self, x0, y0, r, invert=False):
         """Draw a circle.
@@ -294,6 +745,11 @@ class Display(object):
             r (int): Radius.
             invert (bool): True = clear line, False (Default) = draw line.
         """
+        if x0 - r >= 0 and y0 - r >= 0 and x0 + r < self.width and y0 + r < self.height:
+            # Completely on screen: draw all pixels in one go
+            _circle_vlsb(self.mono_image, self.width, x0, y0, r, int(invert) ^ 1)
+            return
+        # Partly off screen: draw_pixel() checks each pixel
         f = 1 - r
         dx = 1
         dy = -r - r
@@ -389,7 +845,8 @@ class Display(object):
             w (int): Width of line.
             invert (bool): True = clear line, False (Default) = draw line.
         """
-        if self.is_off_grid(x, y, x + w - 1, y):
+        if (x | y) < 0 or x + w - 1 > self._w1 or y > self._h1:
+            self.is_off_grid(x, y, x + w - 1, y)  # report it
             return
         self.monoFB.hline(x, y, w, int(invert) ^ 1)
 
@@ -404,7 +861,17 @@ class Display(object):
             invert (bool): Invert color
             rotate (int): Rotation of letter
         """
-        fbuf, w, h = font.get_letter(letter, invert=invert, rotate=rotate)
+        # Fonts make a new frame buffer for every letter, so we keep the
+        # letters we drew last and draw those again.
+        cache = self._glyph_cache
+        key = (font, letter, invert, rotate)
+        glyph = cache.pop(key, None)
+        if glyph is None:
+            glyph = font.get_letter(letter, invert=invert, rotate=rotate)
+            if len(cache) >= _GLYPH_CACHE_SIZE:
+                cache.pop(next(iter(cache)))  # least recently used
+        cache[key] = glyph
+        fbuf, w, h = glyph
         # Check for errors
         if w == 0:
             return w, h
@@ -426,21 +893,12 @@ class Display(object):
             y2 (int): Ending Y-coordinate of the line
             invert (bool): True = clear line, False (Default) = draw line.
         """
-        # Check for horizontal line
-        if y1 == y2:
-            if x1 > x2:
-                x1, x2 = x2, x1
-            self.draw_hline(x1, y1, x2 - x1 + 1, invert)
-            return
-        # Check for vertical line
-        if x1 == x2:
-            if y1 > y2:
-                y1, y2 = y2, y1
-            self.draw_vline(x1, y1, y2 - y1 + 1, invert)
-            return
-        # Confirm coordinates in boundary
-        if self.is_off_grid(min(x1, x2), min(y1, y2),
-                            max(x1, x2), max(y1, y2)):
+        # Confirm coordinates in boundary (framebuf draws horizontal and
+        # vertical lines just as well, so there are no special cases)
+        xmin, xmax = (x1, x2) if x1 <= x2 else (x2, x1)
+        ymin, ymax = (y1, y2) if y1 <= y2 else (y2, y1)
+        if (xmin | ymin) < 0 or xmax > self._w1 or ymax > self._h1:
+            self.is_off_grid(xmin, ymin, xmax, ymax)  # report it
             return
         self.monoFB.line(x1, y1, x2, y2, int(invert) ^ 1)
 
@@ -467,7 +925,8 @@ class Display(object):
             y (int): Y position.
             invert (bool): True = clear line, False (Default) = draw line.
         """
-        if self.is_off_grid(x, y, x, y):
+        if (x | y) < 0 or x > self._w1 or y > self._h1:
+            self.is_off_grid(x, y, x, y)  # report it
             return
         self.monoFB.pixel(x, y, int(invert) ^ 1)
 
@@ -486,15 +945,56 @@ class Display(object):
             Since pixels are not divisible, the radius is integer rounded
             up to complete on a full pixel, therefore diameter = 2 x r + 1.
         """
-        coords = []
-        theta = radians(rotate)
-        n = sides + 1
-        for s in range(n):
-            t = 2.0 * pi * s / sides + theta
-            coords.append([int(r * cos(t) + x0), int(r * sin(t) + y0)])
-
-        # Cast to python float first to fix rounding errors
-        self.draw_lines(coords, invert)
+        coords = self._polygon_coords(sides, x0, y0, r, rotate)
+        end = len(coords) - 2
+        # One bounds test for the whole polygon (all vertices are within r
+        # of the center), instead of one per side.
+        if x0 - r < 0 or y0 - r < 0 or x0 + r >= self.width or y0 + r >= self.height:
+            # Maybe partly off screen: draw_line() checks each side
+            for i in range(0, end, 2):
+                self.draw_line(coords[i], coords[i + 1], coords[i + 2], coords[i + 3], invert)
+            return
+        line = self.monoFB.line
+        color = int(invert) ^ 1
+        for i in range(0, end, 2):
+            line(coords[i], coords[i + 1], coords[i + 2], coords[i + 3], color)
+
+    def _polygon_coords(self, sides, x0, y0, r, rotate):
+        """Return the vertices of a regular polygon, the first one repeated
+           at the end, as a flat array: x1, y1, x2, y2, ...
+           The offsets from the center are kept per (sides, r, rotate), in
+           1/256 pixels, so drawing the same shape again needs no floating
+           point at all."""
+        cache = self._polygon_cache
+        key = (sides, r, rotate)
+        offsets = cache.get(key)
+        if offsets is None:
+            offsets = array('i', [0] * (2 * (sides + 1)))
+            theta = radians(rotate)
+            # Rotate the first vertex step by step around the center,
+            # so we need cos() and sin() only twice.
+            step = 2.0 * pi / sides
+            c = cos(step)
+            s = sin(step)
+            vx = r * cos(theta)
+            vy = r * sin(theta)
+            for i in range(0, 2 * sides, 2):
+                offsets[i] = round(vx * 256)
+                offsets[i + 1] = round(vy * 256)
+                vx, vy = vx * c - vy * s, vx * s + vy * c
+            # Close the polygon exactly, without rounding errors
+            offsets[2 * sides] = offsets[0]
+            offsets[2 * sides + 1] = offsets[1]
+            if len(cache) >= _POLYGON_CACHE_SIZE:
+                cache.clear()  # e.g. a spinning polygon: do not keep them all
+            cache[key] = offsets
+        coords = array('h', [0] * len(offsets))
+        x0 <<= 8
+        y0 <<= 8
+        for i in range(0, len(coords), 2):
+            coords[i] = (offsets[i] + x0) >> 8
+            coords[i + 1] = (offsets[i + 1] + y0) >> 8
+        return coords
 
     def draw_rectangle(self, x, y, w, h, invert=False):
         """Draw a rectangle.
@@ -523,6 +1023,27 @@ class Display(object):
             return
         self.monoFB.blit(fbuf, x, y)
 
+    def draw_sprite_mirrored(self, buf, x, y, w, h):
+        """Draw a sprite, mirrored horizontally.
+           We mirror while drawing, so there is no need to keep a mirrored
+           copy of the sprite in memory.
+        Args:
+            buf (bytearray): MONO_HMSB bitmap to draw.
+            x (int): Starting X position.
+            y (int): Starting Y position.
+            w (int): Width of drawing.
+            h (int): Height of drawing.
+        """
+        x2 = x + w - 1
+        y2 = y + h - 1
+        if self.is_off_grid(x, y, x2, y2):
+            return
+        if self._mirror is None or self._mirror[0] != w or self._mirror[1] != h:
+            buf2 = self._scratch_buf(get_byte_size(w) * h)
+            self._mirror = (w, h, buf2, self.make_fb(buf2, w, h))
+        self.mirror_horizontal(buf, w, h, self._mirror[2])
+        self.monoFB.blit(self._mirror[3], x, y)
+
     def draw_text(self, x, y, text, font, invert=False,
                   rotate=0, spacing=1):
         """Draw text.
@@ -593,7 +1114,8 @@ class Display(object):
             invert (bool): True = clear line, False (Default) = draw line.
         """
         # Confirm coordinates in boundary
-        if self.is_off_grid(x, y, x, y + h):
+        if (x | y) < 0 or x > self._w1 or y + h > self._h1:
+            self.is_off_grid(x, y, x, y + h)  # report it
             return
         self.monoFB.vline(x, y, h, int(invert) ^ 1)
 
@@ -708,29 +1230,44 @@ class Display(object):
             up to complete on a full pixel, therefore diameter = 2 x r + 1.
         """
         # Determine side coordinates
-        coords = []
-        theta = radians(rotate)
-        n = sides + 1
-        for s in range(n):
-            t = 2.0 * pi * s / sides + theta
-            coords.append([int(r * cos(t) + x0), int(r * sin(t) + y0)])
+        coords = self._polygon_coords(sides, x0, y0, r, rotate)
+        height = self.height
+        xmin = self._xmin
+        xmax = self._xmax
+        # Rows the polygon covers (on screen)
+        ylo = yhi = coords[1]
+        for i in range(3, len(coords), 2):
+            y = coords[i]
+            if y < ylo:
+                ylo = y
+            elif y > yhi:
+                yhi = y
+        if ylo < 0:
+            ylo = 0
+        if yhi >= height:
+            yhi = height - 1
+        # Minimum Maximum X per row, start with an empty range
+        for y in range(ylo, yhi + 1):
+            xmin[y] = 32767
+            xmax[y] = -32768
         # Starting point
-        x1, y1 = coords[0]
-        # Minimum Maximum X dict
-        xdict = {y1: [x1, x1]}
+        x1 = coords[0]
+        y1 = coords[1]
         # Iterate through coordinates
-        for row in coords[1:]:
-            x2, y2 = row
+        for i in range(2, len(coords), 2):
+            x2 = coords[i]
+            y2 = coords[i + 1]
             xprev, yprev = x2, y2
             # Calculate perimeter
             # Check for horizontal side
             if y1 == y2:
-                if x1 > x2:
-                    x1, x2 = x2, x1
-                if y1 in xdict:
-                    xdict[y1] = [min(x1, xdict[y1][0]), max(x2, xdict[y1][1])]
-                else:
-                    xdict[y1] = [x1, x2]
+                if 0 <= y1 < height:
+                    if x1 > x2:
+                        x1, x2 = x2, x1
+                    if x1 < xmin[y1]:
+                        xmin[y1] = x1
+                    if x2 > xmax[y1]:
+                        xmax[y1] = x2
                 x1, y1 = xprev, yprev
                 continue
             # Non horizontal side
@@ -749,7 +1286,7 @@ class Display(object):
                 y1, y2 = y2, y1
             # Recalculate differentials
             dx = x2 - x1
-            dy = y2 - y1
+            dy = abs(y2 - y1)
             # Calculate error
             error = dx >> 1
             ystep = 1 if y1 < y2 else -1
@@ -757,23 +1294,33 @@ class Display(object):
             # Calculate minimum and maximum x values
             for x in range(x1, x2 + 1):
                 if is_steep:
-                    if x in xdict:
-                        xdict[x] = [min(y, xdict[x][0]), max(y, xdict[x][1])]
-                    else:
-                        xdict[x] = [y, y]
+                    px, py = y, x
                 else:
-                    if y in xdict:
-                        xdict[y] = [min(x, xdict[y][0]), max(x, xdict[y][1])]
-                    else:
-                        xdict[y] = [x, x]
-                error -= abs(dy)
+                    px, py = x, y
+                if 0 <= py < height:
+                    if px < xmin[py]:
+                        xmin[py] = px
+                    if px > xmax[py]:
+                        xmax[py] = px
+                error -= dy
                 if error < 0:
                     y += ystep
                     error += dx
             x1, y1 = xprev, yprev
         # Fill polygon
-        for y, x in xdict.items():
-            self.draw_hline(x[0], y, x[1] - x[0] + 2, invert)
+        if x0 - r >= 0 and x0 + r + 1 <= self._w1 and y0 - r >= 0 and y0 + r <= self._h1:
+            # All rows are on screen (each row is drawn one pixel wider),
+            # so we can draw them without further checks.
+            hline = self.monoFB.hline
+            color = int(invert) ^ 1
+            for y in range(ylo, yhi + 1):
+                x = xmin[y]
+                if x <= xmax[y]:
+                    hline(x, y, xmax[y] - x + 2, color)
+            return
+        for y in range(ylo, yhi + 1):
+            if xmin[y] <= xmax[y]:
+                self.draw_hline(xmin[y], y, xmax[y] - xmin[y] + 2, invert)
 
     def is_off_grid(self, xmin, ymin, xmax, ymax):
         """Check if coordinates extend past display boundaries.
@@ -786,6 +1333,11 @@ class Display(object):
         Returns:
             boolean: False = Coordinates OK, True = Error.
         """
+        # (x | y) is negative when x or y is negative
+        if (xmin | ymin) >= 0 and xmax <= self._w1 and ymax <= self._h1:
+            return False
+        if not self._verbose:
+            return True
         if xmin < 0:
             print('x-coordinate: {0} below minimum of 0.'.format(xmin))
             return True
@@ -796,11 +1348,9 @@ class Display(object):
             print('x-coordinate: {0} above maximum of {1}.'.format(
                 xmax, self.width - 1))
             return True
-        if ymax >= self.height:
-            print('y-coordinate: {0} above maximum of {1}.'.format(
-                ymax, self.height - 1))
-            return True
-        return False
+        print('y-coordinate: {0} above maximum of {1}.'.format(
+            ymax, self.height - 1))
+        return True
 
     def buf_hmsb_to_vlsb(self, buf, w, h):
         """Convert a bitmap in HMSB format to VLSB.
@@ -817,39 +1367,202 @@ class Display(object):
         w_bytes = get_byte_size(w)
         h_bytes = get_byte_size(h)
         buf2 = bytearray(h_bytes * w)
-        for y1 in range(h):
-            page = y1 >> 3
-            for x1 in range(w):
-                src_idx = (y1 * w_bytes) + (x1 >> 3)
-                src_bit = x1 & 7
-                dst_idx = (page * w) + x1
-                dst_bit = y1 & 7
-                val_bit = ((buf[src_idx] >> src_bit) & 1) << dst_bit
-                buf2[dst_idx] |= val_bit
+        _hmsb_to_vlsb(buf, buf2, w, h, w_bytes)
         buf = buf2
         return buf
 
-    def present_buf(self, buf, w, h):
-        """Present image (given as parameters) to display."""
+    def set_window(self, w, h, page=0):
+        """Set the display RAM area that the following image data fills.
+           In horizontal addressing mode the RAM pointer wraps around within
+           this area, so we only have to send it when the area changes.
+
+            Args:
+                w (int): horizontal width.
+                h (int): vertical height.
+                page (Optional int): first page (row of 8 pixels) of the area.
+        """
+        if self._window == (w, h, page):
+            return
         column_beg = 0
         column_end = w - 1
         if w == 64:
             # displays with width of 64 pixels are shifted by 32
             column_beg += 32
             column_end += 32
-        pages_beg = 0
-        pages_end = (h >> 3) - 1
-        self.write_cmd(self.COLUMN_ADDRESS)
-        self.write_cmd(column_beg)
-        self.write_cmd(column_end)
-        self.write_cmd(self.PAGE_ADDRESS)
-        self.write_cmd(pages_beg)
-        self.write_cmd(pages_end)
+        pages_beg = page
+        pages_end = page + (h >> 3) - 1
+        self._window = None  # unknown until the commands have been sent
+        cmds = self._window_cmds  # control byte 0x00 stays in front
+        cmds[1] = self.COLUMN_ADDRESS
+        cmds[2] = column_beg
+        cmds[3] = column_end
+        cmds[4] = self.PAGE_ADDRESS
+        cmds[5] = pages_beg
+        cmds[6] = pages_end
+        self.wait_present()
+        self._i2c_writeto(self.address, cmds)
+        self._window = (w, h, page)
+
+    def present_buf(self, buf, w, h):
+        """Present image (given as parameters) to display."""
+        self.set_window(w, h)
         self.write_data(buf)
 
+    def write_image(self, src, n):
+        """Write image data (n bytes from src) to display in one transaction.
+           With DMA we return as soon as the transfer has started; src may
+           be changed right away, since the data is copied first.
+           The copy goes to the command buffer that is not being sent,
+           so it can be made while the previous image is still on its way.
+        """
+        if self._dma is None:
+            self.write_data(src)
+            return
+        dma_buf = self._dma_bufs[self._dma_next]
+        self._dma_next ^= 1
+        _i2c_data_cmds(src, n, dma_buf)
+        try:
+            self.wait_present()
+        except OSError:
+            self._window = None  # the RAM pointer may have stopped mid-window
+            raise
+        regs = self._i2c_regs
+        mem32[regs + _IC_ENABLE] = 0  # the target address can only be set while disabled
+        mem32[regs + _IC_TAR] = self.address
+        mem32[regs + _IC_ENABLE] = 1
+        self._dma.config(read=dma_buf, write=regs + _IC_DATA_CMD, count=n + 1,
+                         ctrl=self._dma_ctrl, trigger=True)
+
+    def wait_present(self):
+        """Wait until image data sent with DMA has been sent completely.
+           All other I2C communication with the display calls this first."""
+        if self._dma is None:
+            return
+        regs = self._i2c_regs
+        start = ticks_ms()
+        # busy: DMA still running, or TX FIFO not empty (TFE) or controller active
+        while self._dma.active() or (mem32[regs + _IC_STATUS] & 0x24) != 0x04:
+            if (mem32[regs + _IC_RAW_INTR_STAT] & 0x40) or ticks_diff(ticks_ms(), start) > _DMA_TIMEOUT:
+                self._stop_dma()
+                raise OSError(5)  # EIO, like I2C.writeto() when there is no ACK
+
+    def _stop_dma(self):
+        """Stop a DMA transfer that failed (no ACK, or timeout), and leave
+           the I2C hardware ready for the next transfer."""
+        regs = self._i2c_regs
+        self._dma.active(0)
+        # ABORT: the controller sends a STOP and empties the TX FIFO,
+        # so no commands of this transfer are left behind.
+        mem32[regs + _IC_ENABLE] = 0x03
+        start = ticks_ms()
+        while mem32[regs + _IC_ENABLE] & 0x02 and ticks_diff(ticks_ms(), start) < 10:
+            pass
+        mem32[regs + _IC_CLR_TX_ABRT]  # reading clears the abort state
+        self._window = None  # the RAM pointer stopped somewhere in the window
+
     def present(self):
-        """Present image (from internal frame buffer) to display."""
-        self.present_buf(self.mono_image, self.width, self.height)
+        """Present image (from internal frame buffer) to display.
+           The frame buffer sits right behind the control byte in the transmit
+           buffer, so the whole image is sent in one I2C transaction, as it is."""
+        self.present_prepped(self._txbuf)
+
+    def present_pages(self, pages):
+        """Present only some pages (rows of 8 pixels) of the internal frame
+           buffer to display. When only a part of the image changed since the
+           last present(), this saves I2C transfer time.
+           Consecutive pages are sent together, as one area.
+
+            Args:
+                pages (int): bit mask, bit n set = send page n.
+        """
+        self.present_prepped(self._txbuf, pages)
+
+    def _page_runs(self, pages):
+        """Yield (first page, number of pages) for each run of set bits."""
+        page = 0
+        while pages:
+            if not pages & 1:
+                pages >>= 1
+                page += 1
+                continue
+            n = 0
+            while pages & 1:
+                pages >>= 1
+                n += 1
+            yield page, n
+            page += n
+
+    def copy_prepped(self):
+        """Copy the internal frame buffer to a new 'prepped' buffer:
+           the control byte 0x40 followed by the image in the format
+           the OLED needs (VLSB). See present_prepped().
+
+            Returns:
+                bytearray: prepped image
+        """
+        return bytearray(self._txbuf)
+
+    def mirror_prepped(self, buf):
+        """Mirror a prepped image horizontally.
+           The result goes to a scratch buffer, that the next call reuses.
+
+            Args:
+                buf (bytearray): prepped image (see copy_prepped()).
+            Returns:
+                bytearray: mirrored prepped image
+        """
+        if self._mirror_prepped is None or len(self._mirror_prepped) != len(buf):
+            self._mirror_prepped = bytearray(len(buf))
+            self._mirror_prepped[0] = 0x40
+        _mirror_pages(buf, self._mirror_prepped, self.width, self.pages)
+        return self._mirror_prepped
+
+    def present_prepped(self, buf, pages=0xFF):
+        """Present a prepped full screen image (see copy_prepped()) to display.
+           Without DMA, the buffer is sent as it is, without any copying.
+           To send only some pages, the byte before each part temporarily
+           becomes the control byte; a read-only buffer (bytes) is sent
+           with write_data() instead.
+
+            Args:
+                buf (bytearray or bytes): prepped image.
+                pages (Optional int): bit mask, bit n set = send page n (default: all).
+        """
+        pages &= self._all_pages  # only pages the display has
+        if pages == self._all_pages:
+            # The whole image (the common case): one window, one transfer
+            self.set_window(self.width, self.height)
+            if self._dma is not None:
+                self.write_image(memoryview(buf)[1:], self.buffer_length)
+                return
+            try:
+                self._i2c_writeto(self.address, buf)
+            except OSError:
+                self._window = None  # the RAM pointer may have stopped mid-window
+                raise
+            return
+        w = self.width
+        mv = memoryview(buf)
+        for page, n in self._page_runs(pages):
+            self.set_window(w, n << 3, page)
+            beg = page * w
+            length = n * w
+            if self._dma is not None:
+                self.write_image(mv[1 + beg:1 + beg + length], length)
+                continue
+            if not isinstance(buf, bytearray):  # read-only, we cannot borrow a byte
+                self.write_data(mv[1 + beg:1 + beg + length])
+                continue
+            # The byte before the data temporarily becomes the control byte.
+            keep = buf[beg]
+            buf[beg] = 0x40
+            try:
+                self._i2c_writeto(self.address, mv[beg:1 + beg + length])
+            except OSError:
+                self._window = None  # the RAM pointer may have stopped mid-window
+                raise
+            finally:
+                buf[beg] = keep
 
     def reset(self):
         """Perform reset."""
@@ -0,0 +1,82 @@
+# Run-length encoder for monochrome bitmap files (*.mono -> *.rle)
+# Copyright 2024 Hogeschool Utrecht
+# Made available under MIT License
+#
+# Runs on the PC (desktop Python), not on the Pico.
+# Decode on the Pico with Display.load_rle() from ssd1309.py.
+#
+# File format: a sequence of blocks, each starting with a control byte c:
+# - c < 0x80: c + 1 literal bytes follow (1 ... 128)
+# - c >= 0x80: one byte follows, to be repeated (c & 0x7F) + 3 times (3 ... 130)
+#
+# Usage: python tools/rle_encode.py [-o OUTDIR] FILE.mono [FILE.mono ...]
+import argparse
+import os
+
+MIN_RUN = 3
+MAX_RUN = 0x7F + MIN_RUN
+MAX_LITERAL = 0x80
+
+
+def rle_encode(data):
+    """Encode bytes, returns the run-length encoded bytes."""
+    out = bytearray()
+    literal = bytearray()
+
+    def flush_literal():
+        for beg in range(0, len(literal), MAX_LITERAL):
+            chunk = literal[beg:beg + MAX_LITERAL]
+            out.append(len(chunk) - 1)
+            out.extend(chunk)
+        literal.clear()
+
+    idx = 0
+    while idx < len(data):
+        end = idx
+        while end < len(data) and data[end] == data[idx] and end - idx < MAX_RUN:
+            end += 1
+        if end - idx >= MIN_RUN:
+            flush_literal()
+            out.append(0x80 | (end - idx - MIN_RUN))
+            out.append(data[idx])
+            idx = end
+        else:
+            literal.append(data[idx])
+            idx += 1
+    flush_literal()
+    return bytes(out)
+
+
+def rle_decode(data):
+    """Decode run-length encoded bytes (reference for Display.load_rle())."""
+    out = bytearray()
+    idx = 0
+    while idx < len(data):
+        c = data[idx]
+        if c & 0x80:
+            out.extend(data[idx + 1:idx + 2] * ((c & 0x7F) + MIN_RUN))
+            idx += 2
+        else:
+            out.extend(data[idx + 1:idx + 2 + c])
+            idx += 2 + c
+    return bytes(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run-length encode monochrome bitmap files.")
+    parser.add_argument("files", nargs="+", help="bitmap files to encode (*.mono)")
+    parser.add_argument("-o", "--outdir", default=".", help="directory for the *.rle files")
+    args = parser.parse_args()
+    for path in args.files:
+        with open(path, "rb") as f:
+            data = f.read()
+        encoded = rle_encode(data)
+        assert rle_decode(encoded) == data
+        name = os.path.splitext(os.path.basename(path))[0] + ".rle"
+        with open(os.path.join(args.outdir, name), "wb") as f:
+            f.write(encoded)
+        print(f"{path}: {len(data)} -> {len(encoded)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Converter for monochrome bitmap files to the format the OLED needs (*.mono -> *.vspr)
+# Copyright 2024 Hogeschool Utrecht
+# Made available under MIT License
+#
+# Runs on the PC (desktop Python), not on the Pico.
+# Load on the Pico with Display.load_vlsb_sprite() or Display.draw_bitmap_vlsb()
+# from ssd1309.py, without any conversion there.
+#
+# Input: MONO_HMSB data, one row after another, bit 0 = leftmost pixel.
+# Output file format ('VLSB sprite'):
+# - 4 byte header: width and height, 2 bytes each, little endian
+# - MONO_VLSB data: one byte per 8 vertical pixels (bit 0 = top),
+#   one 'page' row of width bytes after another
+#
+# Usage: python tools/vlsb_encode.py [-o OUTDIR] -W WIDTH -H HEIGHT FILE.mono [FILE.mono ...]
+import argparse
+import os
+
+
+def hmsb_to_vlsb(data, w, h):
+    """Convert MONO_HMSB bytes to MONO_VLSB (same as Display.buf_hmsb_to_vlsb())."""
+    w_bytes = (w + 7) // 8
+    out = bytearray(w * ((h + 7) // 8))
+    for y in range(h):
+        for x in range(w):
+            if (data[y * w_bytes + (x >> 3)] >> (x & 7)) & 1:
+                out[(y >> 3) * w + x] |= 1 << (y & 7)
+    return bytes(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert monochrome bitmap files to VLSB sprites.")
+    parser.add_argument("files", nargs="+", help="bitmap files to convert (*.mono)")
+    parser.add_argument("-W", "--width", type=int, required=True, help="bitmap width in pixels")
+    parser.add_argument("-H", "--height", type=int, required=True, help="bitmap height in pixels")
+    parser.add_argument("-o", "--outdir", default=".", help="directory for the *.vspr files")
+    args = parser.parse_args()
+    w, h = args.width, args.height
+    for path in args.files:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < ((w + 7) // 8) * h:
+            parser.error(f"{path}: too small for {w} x {h} pixels")
+        header = w.to_bytes(2, "little") + h.to_bytes(2, "little")
+        name = os.path.splitext(os.path.basename(path))[0] + ".vspr"
+        with open(os.path.join(args.outdir, name), "wb") as f:
+            f.write(header + hmsb_to_vlsb(data, w, h))
+        print(f"{path}: {w} x {h} -> {name}")
+
+
+if __name__ == "__main__":
+    main()